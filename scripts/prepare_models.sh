@@ -104,7 +104,42 @@ download_model() {
     echo "  URL: $url"
     echo "  Size: $((size / 1024 / 1024))MB"
 
-    curl -L -o "$output_file" "$url"
+    # Download into a .tmp file and resume it if a previous run was interrupted,
+    # so a partial file is never mistaken for a completed download.
+    # Note: a resumed file is not verified. There is no checksum for these
+    # models, so if the remote file changed between runs the old prefix is
+    # joined to the new suffix undetected.
+    local temp_file="${output_file}.tmp"
+    if [ -f "$temp_file" ]; then
+        echo "  Resuming from: $temp_file"
+    fi
+
+    # curl's status is checked explicitly: set -e does not apply when this
+    # function runs from an || list (as in prepare_all)
+    local status=0
+    local http_code
+    http_code=$(curl -f -L -C - -w '%{http_code}' -o "$temp_file" "$url") || status=$?
+
+    # Start over from zero when the .tmp cannot be resumed:
+    #   33  - server ignored the Range request
+    #   416 - .tmp is already complete, or larger than the remote file
+    if [ "$status" -eq 33 ] || { [ "$status" -eq 22 ] && [ "$http_code" = "416" ]; }; then
+        echo -e "${YELLOW}Cannot resume from $temp_file, restarting download${NC}"
+        rm -f "$temp_file"
+        status=0
+        curl -f -L -o "$temp_file" "$url" || status=$?
+    fi
+
+    if [ "$status" -ne 0 ]; then
+        if [ -f "$temp_file" ]; then
+            echo -e "${RED}Download failed; partial file kept at $temp_file${NC}"
+        else
+            echo -e "${RED}Download failed${NC}"
+        fi
+        return 1
+    fi
+
+    mv "$temp_file" "$output_file" || return 1
 
     # Verify size
     actual_size=$(stat -f%z "$output_file" 2>/dev/null || stat -c%s "$output_file" 2>/dev/null)